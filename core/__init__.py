@@ -1,3 +1,8 @@
+from .manifest import ManifestCache, get_manifest, parse_manifest_bytes
+from .members import is_symlink_entry, is_unsafe_member_path, normalize_member_path
+from .payload_cache import PayloadCache, stored_member_range
+from .verify import MemberCheck, VerifyResult, verify_package
+from .zip_cache import ZipCacheEntry, ZipHandleCache, close_cached_zips, get_cached_zip
 from .safe_open import (
     InvalidArchiveError,
     MissingManifestError,
@@ -12,6 +17,21 @@ from .safe_open import (
 )
 
 __all__ = [
+    "PayloadCache",
+    "stored_member_range",
+    "ZipCacheEntry",
+    "ZipHandleCache",
+    "close_cached_zips",
+    "get_cached_zip",
+    "verify_package",
+    "VerifyResult",
+    "MemberCheck",
+    "ManifestCache",
+    "get_manifest",
+    "parse_manifest_bytes",
+    "normalize_member_path",
+    "is_unsafe_member_path",
+    "is_symlink_entry",
     "safe_open_package",
     "SafeOpenResult",
     "SafeOpenError",
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import json
+import threading
+import zipfile
+from collections import OrderedDict
+from pathlib import Path
+
+from .zip_cache import get_cached_zip
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+_MAX_CACHED_MANIFESTS = 32
+
+
+def parse_manifest_bytes(raw: bytes) -> dict | None:
+    parsed = None
+    if orjson is not None:
+        # orjson decodes bytes directly (no intermediate str) and is several
+        # times faster than the stdlib on typical manifests.
+        try:
+            parsed = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            parsed = None
+    if parsed is None:
+        try:
+            parsed = json.loads(raw.decode("utf-8", errors="replace"))
+        except ValueError:
+            return None
+    if not isinstance(parsed, dict):
+        return None
+    return parsed
+
+
+class ManifestCache:
+    def __init__(self, max_entries: int = _MAX_CACHED_MANIFESTS) -> None:
+        self._max_entries = max_entries
+        # Maps resolved package path -> ((mtime_ns, size), parsed manifest).
+        self._entries: OrderedDict[Path, tuple[tuple[int, int], dict | None]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, package_path: str | Path) -> dict | None:
+        try:
+            resolved = Path(package_path).resolve()
+            entry = get_cached_zip(resolved)
+        except (zipfile.BadZipFile, zipfile.LargeZipFile, OSError):
+            return None
+
+        with self._lock:
+            cached = self._entries.get(resolved)
+            if cached is not None and cached[0] == entry.stat_key:
+                self._entries.move_to_end(resolved)
+                return cached[1]
+
+        raw_name = entry.normalized_to_raw.get("manifest.json")
+
+        manifest: dict | None = None
+        if raw_name is not None:
+            try:
+                manifest = parse_manifest_bytes(entry.zipfile.read(raw_name))
+            except (zipfile.BadZipFile, zipfile.LargeZipFile, OSError, KeyError):
+                manifest = None
+
+        with self._lock:
+            self._entries[resolved] = (entry.stat_key, manifest)
+            self._entries.move_to_end(resolved)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return manifest
+
+
+_default_cache = ManifestCache()
+
+
+def get_manifest(package_path: str | Path) -> dict | None:
+    return _default_cache.get(package_path)
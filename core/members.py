@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from pathlib import PurePosixPath
+import zipfile
+
+
+def normalize_member_path(raw_name: str) -> str:
+    normalized = raw_name.replace("\\", "/")
+    while normalized.startswith("./"):
+        normalized = normalized[2:]
+    return normalized
+
+
+def is_unsafe_member_path(normalized: str) -> bool:
+    if not normalized:
+        return True
+    if normalized.startswith("/"):
+        return True
+    if len(normalized) >= 2 and normalized[1] == ":":
+        return True
+    return ".." in PurePosixPath(normalized).parts
+
+
+def is_symlink_entry(info: zipfile.ZipInfo) -> bool:
+    mode = (info.external_attr >> 16) & 0o170000
+    return mode == 0o120000
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import os
+import shutil
+import struct
+import sys
+import tempfile
+import threading
+import zipfile
+from pathlib import Path
+
+from .members import normalize_member_path
+from .zip_cache import get_cached_zip
+
+
+# Stream extraction through a fixed-size buffer so peak memory stays O(buffer)
+# instead of O(member size).
+_COPY_BUFFER_SIZE = 1 << 20
+
+_LOCAL_HEADER_SIZE = 30
+_LOCAL_HEADER_MAGIC = b"PK\x03\x04"
+
+
+def _stored_range_from_info(package_path: Path, info: zipfile.ZipInfo) -> tuple[int, int] | None:
+    if info.compress_type != zipfile.ZIP_STORED:
+        return None
+    if info.file_size != info.compress_size:
+        return None
+    if info.flag_bits & 0x1:  # encrypted
+        return None
+
+    # The central directory's extra field can differ from the local header's,
+    # so the data offset must be derived from the local header itself.
+    try:
+        with open(package_path, "rb") as f:
+            f.seek(info.header_offset)
+            header = f.read(_LOCAL_HEADER_SIZE)
+    except OSError:
+        return None
+    if len(header) != _LOCAL_HEADER_SIZE or not header.startswith(_LOCAL_HEADER_MAGIC):
+        return None
+    name_length, extra_length = struct.unpack("<HH", header[26:30])
+    data_offset = info.header_offset + _LOCAL_HEADER_SIZE + name_length + extra_length
+    return data_offset, info.file_size
+
+
+def _copy_file_range(src_path: Path, src_range: tuple[int, int], dst_path: Path) -> bool:
+    offset, size = src_range
+    try:
+        with open(src_path, "rb") as src, open(dst_path, "wb") as dst:
+            if hasattr(os, "sendfile"):
+                try:
+                    remaining = size
+                    position = offset
+                    while remaining > 0:
+                        sent = os.sendfile(dst.fileno(), src.fileno(), position, remaining)
+                        if sent == 0:
+                            break
+                        position += sent
+                        remaining -= sent
+                    if remaining == 0:
+                        return True
+                except OSError:
+                    # Not every platform supports sendfile between regular
+                    # files; restart with the buffered path below.
+                    pass
+                dst.seek(0)
+                dst.truncate()
+            src.seek(offset)
+            copied = 0
+            while copied < size:
+                chunk = src.read(min(_COPY_BUFFER_SIZE, size - copied))
+                if not chunk:
+                    break
+                dst.write(chunk)
+                copied += len(chunk)
+            return copied == size
+    except OSError:
+        return False
+
+
+def stored_member_range(package_path: str | Path, member_path: str) -> tuple[int, int] | None:
+    # For uncompressed (ZIP_STORED) members the payload is a contiguous byte
+    # range inside the package, so callers can read it in place with no
+    # extraction and no inflate. Returns (data offset, size), or None when
+    # the member is compressed, encrypted, missing, or unsafe.
+    path_obj = Path(package_path)
+    normalized_target = normalize_member_path(member_path)
+    try:
+        entry = get_cached_zip(path_obj)
+        raw_name = entry.safe_normalized_to_raw.get(normalized_target)
+        if raw_name is None:
+            return None
+        info = entry.zipfile.getinfo(raw_name)
+    except (zipfile.BadZipFile, zipfile.LargeZipFile, OSError, KeyError):
+        return None
+
+    return _stored_range_from_info(path_obj, info)
+
+
+def _temp_root_parent() -> str | None:
+    # Prefer RAM-backed tmpfs on Linux: extracted media then never touches
+    # disk, writes are memory-speed, and the files vanish with the mount
+    # even if cleanup is skipped by a crash. None falls back to the
+    # platform default temp dir.
+    if not sys.platform.startswith("linux"):
+        return None
+    shm = Path("/dev/shm")
+    if shm.is_dir() and os.access(shm, os.W_OK):
+        return str(shm)
+    return None
+
+
+class PayloadCache:
+    def __init__(self) -> None:
+        self._temp_root = Path(tempfile.mkdtemp(prefix="aifx-player-", dir=_temp_root_parent()))
+        # Maps (resolved package path, member path) -> (extracted file, the
+        # package's (mtime_ns, size) at extraction time). The stat key acts
+        # as a freshness check so a rewritten package is re-extracted.
+        self._extracted: dict[tuple[Path, str], tuple[Path, tuple[int, int]]] = {}
+        self._next_index = 0
+        # Guards the map and index; extraction itself runs unlocked so
+        # background prefetch threads can extract members in parallel.
+        self._lock = threading.Lock()
+
+    @property
+    def temp_root(self) -> Path:
+        return self._temp_root
+
+    def get_media_file(self, package_path: str | Path, member_path: str) -> Path | None:
+        path_obj = Path(package_path)
+        normalized_target = normalize_member_path(member_path)
+        try:
+            resolved_package = path_obj.resolve()
+        except OSError:
+            return None
+
+        key = (resolved_package, normalized_target)
+        try:
+            entry = get_cached_zip(path_obj)
+            with self._lock:
+                cached = self._extracted.get(key)
+            if cached is not None:
+                cached_path, cached_stat_key = cached
+                if cached_stat_key == entry.stat_key and cached_path.exists():
+                    return cached_path
+            raw_name = entry.safe_normalized_to_raw.get(normalized_target)
+            if raw_name is None:
+                return None
+            return self._extract_member(
+                entry.zipfile, entry.zipfile.getinfo(raw_name), key, entry.stat_key
+            )
+        except (zipfile.BadZipFile, zipfile.LargeZipFile, OSError, KeyError):
+            return None
+
+    def _extract_member(
+        self,
+        zf: zipfile.ZipFile,
+        info: zipfile.ZipInfo,
+        key: tuple[Path, str],
+        stat_key: tuple[int, int],
+    ) -> Path | None:
+        suffix = Path(key[1]).suffix
+        with self._lock:
+            dst_path = self._temp_root / f"{self._next_index:06d}{suffix}"
+            self._next_index += 1
+
+        package_path = Path(zf.filename) if zf.filename else None
+        stored_range = (
+            _stored_range_from_info(package_path, info) if package_path is not None else None
+        )
+        try:
+            if stored_range is not None:
+                # Uncompressed member: copy the raw byte range, in kernel
+                # space where sendfile is available.
+                if not _copy_file_range(package_path, stored_range, dst_path):
+                    dst_path.unlink(missing_ok=True)
+                    return None
+            else:
+                with zf.open(info) as src, open(dst_path, "wb") as dst:
+                    shutil.copyfileobj(src, dst, _COPY_BUFFER_SIZE)
+        except (zipfile.BadZipFile, zipfile.LargeZipFile, OSError):
+            dst_path.unlink(missing_ok=True)
+            return None
+        with self._lock:
+            current = self._extracted.get(key)
+            if current is not None and current[1] == stat_key and current[0].exists():
+                # Another thread extracted the same member first; keep its
+                # file since callers may already hold that path.
+                dst_path.unlink(missing_ok=True)
+                return current[0]
+            if current is not None:
+                current[0].unlink(missing_ok=True)
+            self._extracted[key] = (dst_path, stat_key)
+        return dst_path
+
+    def close(self) -> None:
+        with self._lock:
+            self._extracted.clear()
+        shutil.rmtree(self._temp_root, ignore_errors=True)
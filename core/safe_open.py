@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from pathlib import Path, PurePosixPath
+from pathlib import Path
 from typing import Literal, Sequence
 import zipfile
 
+from .members import is_symlink_entry, is_unsafe_member_path, normalize_member_path
+from .zip_cache import get_cached_zip
+
 
 PackageType = Literal["aifm", "aifv", "aifi", "aifp"]
 
@@ -52,12 +55,15 @@ class SafeOpenResult:
     file_paths: tuple[str, ...]
 
 
-_PRIMARY_MEDIA_EXTENSIONS: dict[str, tuple[str, ...]] = {
-    "aifm": (".mp3", ".wav", ".flac", ".m4a", ".aac", ".ogg", ".opus"),
-    "aifv": (".mp4", ".mov", ".mkv", ".webm", ".m4v"),
-    "aifi": (".png", ".jpg", ".jpeg", ".webp"),
+# Frozensets so the per-path membership test below is O(1).
+_PRIMARY_MEDIA_EXTENSIONS: dict[str, frozenset[str]] = {
+    "aifm": frozenset({".mp3", ".wav", ".flac", ".m4a", ".aac", ".ogg", ".opus"}),
+    "aifv": frozenset({".mp4", ".mov", ".mkv", ".webm", ".m4v"}),
+    "aifi": frozenset({".png", ".jpg", ".jpeg", ".webp"}),
 }
 
+_PRIMARY_MEDIA_PREFIXES = ("assets/", "payload/")
+
 
 def _detect_package_type(path: Path) -> PackageType:
     suffix = path.suffix.lower()
@@ -72,39 +78,36 @@ def _detect_package_type(path: Path) -> PackageType:
     raise UnsupportedPackageTypeError(f"Unsupported package extension: {suffix or '<none>'}")
 
 
-def _normalize_member_path(raw_name: str) -> str:
-    normalized = raw_name.replace("\\", "/")
-    while normalized.startswith("./"):
-        normalized = normalized[2:]
-    return normalized
-
-
 def _validate_member_safety(info: zipfile.ZipInfo) -> None:
-    normalized = _normalize_member_path(info.filename)
-    if not normalized:
-        raise UnsafeArchivePathError(f"Unsafe archive member path: {info.filename!r}")
-
-    if normalized.startswith("/"):
+    normalized = normalize_member_path(info.filename)
+    if is_unsafe_member_path(normalized):
         raise UnsafeArchivePathError(f"Unsafe archive member path: {info.filename!r}")
 
-    if len(normalized) >= 2 and normalized[1] == ":":
-        raise UnsafeArchivePathError(f"Unsafe archive member path: {info.filename!r}")
-
-    if ".." in PurePosixPath(normalized).parts:
-        raise UnsafeArchivePathError(f"Unsafe archive member path: {info.filename!r}")
-
-    mode = (info.external_attr >> 16) & 0o170000
-    if mode == 0o120000:
+    if is_symlink_entry(info):
         raise SymlinkEntryNotAllowedError(f"Symlink entry not allowed: {info.filename!r}")
 
 
-def _collect_file_paths(zf: zipfile.ZipFile) -> tuple[str, ...]:
+def _scan_members(
+    infolist: Sequence[zipfile.ZipInfo], package_type: str
+) -> tuple[tuple[str, ...], list[str]]:
+    # One pass over the central directory: validate safety, collect file
+    # paths, and gather primary-media candidates along the way.
+    allowed_exts = _PRIMARY_MEDIA_EXTENSIONS.get(package_type)
     file_paths: list[str] = []
-    for info in zf.infolist():
+    candidates: list[str] = []
+    for info in infolist:
         _validate_member_safety(info)
-        if not info.is_dir():
-            file_paths.append(_normalize_member_path(info.filename))
-    return tuple(file_paths)
+        if info.is_dir():
+            continue
+        normalized = normalize_member_path(info.filename)
+        file_paths.append(normalized)
+        if (
+            allowed_exts is not None
+            and normalized.startswith(_PRIMARY_MEDIA_PREFIXES)
+            and Path(normalized).suffix.lower() in allowed_exts
+        ):
+            candidates.append(normalized)
+    return tuple(file_paths), candidates
 
 
 def _find_manifest_path(file_paths: Sequence[str]) -> str:
@@ -113,16 +116,10 @@ def _find_manifest_path(file_paths: Sequence[str]) -> str:
     raise MissingManifestError("Missing required manifest.json at archive root")
 
 
-def _select_primary_media_path(package_type: str, file_paths: Sequence[str]) -> str | None:
+def _select_primary_media_path(package_type: str, candidates: Sequence[str]) -> str | None:
     if package_type == "aifp":
         return None
 
-    allowed_exts = _PRIMARY_MEDIA_EXTENSIONS[package_type]
-    candidates = [
-        path
-        for path in file_paths
-        if (path.startswith("assets/") or path.startswith("payload/")) and Path(path).suffix.lower() in allowed_exts
-    ]
     if not candidates:
         raise PrimaryMediaNotFoundError(
             f"No primary media found under assets/ for package type {package_type}"
@@ -135,37 +132,38 @@ def _select_primary_media_path(package_type: str, file_paths: Sequence[str]) ->
     return candidates[0]
 
 
-def safe_open_package(package_path: str | Path) -> SafeOpenResult:
+def safe_open_package(
+    package_path: str | Path,
+    *,
+    include_primary_media_bytes: bool = True,
+) -> SafeOpenResult:
     path_obj = Path(package_path)
     package_type = _detect_package_type(path_obj)
 
     try:
-        with zipfile.ZipFile(path_obj, "r") as zf:
-            file_paths = _collect_file_paths(zf)
-            manifest_path = _find_manifest_path(file_paths)
-            primary_media_path = _select_primary_media_path(package_type, file_paths)
-
-            # Keep reads minimal and in-memory only.
-            normalized_to_raw: dict[str, str] = {}
-            for info in zf.infolist():
-                if info.is_dir():
-                    continue
-                normalized = _normalize_member_path(info.filename)
-                normalized_to_raw.setdefault(normalized, info.filename)
-
+        # The cached handle keeps the central directory parsed across calls.
+        entry = get_cached_zip(path_obj)
+        zf = entry.zipfile
+        file_paths, candidates = _scan_members(entry.infolist, package_type)
+        manifest_path = _find_manifest_path(file_paths)
+        primary_media_path = _select_primary_media_path(package_type, candidates)
+
+        # Keep reads minimal and in-memory only.
+        normalized_to_raw = entry.normalized_to_raw
+
+        try:
+            manifest_bytes = zf.read(normalized_to_raw[manifest_path])
+        except KeyError as exc:
+            raise MissingManifestError("Missing required manifest.json at archive root") from exc
+
+        primary_media_bytes: bytes | None = None
+        if primary_media_path is not None and include_primary_media_bytes:
             try:
-                manifest_bytes = zf.read(normalized_to_raw[manifest_path])
+                primary_media_bytes = zf.read(normalized_to_raw[primary_media_path])
             except KeyError as exc:
-                raise MissingManifestError("Missing required manifest.json at archive root") from exc
-
-            primary_media_bytes: bytes | None = None
-            if primary_media_path is not None:
-                try:
-                    primary_media_bytes = zf.read(normalized_to_raw[primary_media_path])
-                except KeyError as exc:
-                    raise PrimaryMediaNotFoundError(
-                        f"No primary media found under assets/ for package type {package_type}"
-                    ) from exc
+                raise PrimaryMediaNotFoundError(
+                    f"No primary media found under assets/ for package type {package_type}"
+                ) from exc
 
     except UnsupportedPackageTypeError:
         raise
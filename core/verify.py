@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Literal
+
+from .manifest import get_manifest
+from .members import normalize_member_path
+from .safe_open import InvalidArchiveError
+from .zip_cache import get_cached_zip
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+
+VerifyStatus = Literal["pass", "manifest_mismatch", "fail", "unverified"]
+
+_HASH_CHUNK_SIZE = 1 << 16
+
+# sha256.update releases the GIL for large buffers, so hashing members in
+# a small thread pool scales across cores.
+_MAX_HASH_WORKERS = 8
+
+
+@dataclass(frozen=True)
+class MemberCheck:
+    path: str
+    ok: bool
+    expected_digest: str | None
+    actual_digest: str | None
+    byte_length: int | None
+
+
+@dataclass(frozen=True)
+class VerifyResult:
+    package_path: Path
+    algorithm: str
+    status: VerifyStatus
+    checks: tuple[MemberCheck, ...]
+
+
+def _new_hasher(algorithm: str):
+    if algorithm == "blake3":
+        # Optional dependency; producers opt in via integrity.algorithm.
+        return blake3.blake3() if blake3 is not None else None
+    try:
+        # usedforsecurity=False lets hashlib prefer the OpenSSL backend,
+        # which uses hardware SHA extensions where available.
+        return hashlib.new(algorithm, usedforsecurity=False)
+    except TypeError:
+        try:
+            return hashlib.new(algorithm)
+        except ValueError:
+            return None
+    except ValueError:
+        return None
+
+
+def _stream_digest(fh: BinaryIO, algorithm: str) -> str | None:
+    hasher = _new_hasher(algorithm)
+    if hasher is None:
+        return None
+    if hasattr(hashlib, "file_digest"):
+        # Streams in C without materializing the member; the digest loop
+        # releases the GIL for large buffers.
+        return hashlib.file_digest(fh, lambda: hasher).hexdigest().lower()
+    for chunk in iter(lambda: fh.read(_HASH_CHUNK_SIZE), b""):
+        hasher.update(chunk)
+    return hasher.hexdigest().lower()
+
+
+def _integrity_entries(manifest: dict) -> tuple[str, list[tuple[str, str]]] | None:
+    integrity = manifest.get("integrity")
+    if not isinstance(integrity, dict):
+        return None
+
+    algorithm = str(integrity.get("algorithm") or "sha256").lower()
+    raw_files = integrity.get("files")
+
+    entries: list[tuple[str, str]] = []
+    if isinstance(raw_files, dict):
+        for relpath, digest in raw_files.items():
+            if isinstance(relpath, str) and isinstance(digest, str):
+                entries.append((relpath, digest.lower()))
+    elif isinstance(raw_files, list):
+        for item in raw_files:
+            if not isinstance(item, dict):
+                continue
+            relpath = item.get("path")
+            digest = item.get(algorithm) or item.get("hash")
+            if isinstance(relpath, str) and isinstance(digest, str):
+                entries.append((relpath, digest.lower()))
+    else:
+        return None
+
+    return algorithm, entries
+
+
+def _check_member(
+    package_path: Path,
+    normalized_to_raw: dict[str, str],
+    relpath: str,
+    expected: str,
+    algorithm: str,
+) -> MemberCheck:
+    normalized = normalize_member_path(relpath)
+    raw_name = normalized_to_raw.get(normalized)
+    if raw_name is None:
+        return MemberCheck(
+            path=normalized,
+            ok=False,
+            expected_digest=expected,
+            actual_digest=None,
+            byte_length=None,
+        )
+
+    byte_length: int | None = None
+    try:
+        # Each check opens its own handle so concurrent hashers do not
+        # serialize on a shared ZipFile lock.
+        with zipfile.ZipFile(package_path, "r") as zf:
+            # file_size comes from the central directory; no extra I/O needed.
+            byte_length = zf.getinfo(raw_name).file_size
+            with zf.open(raw_name) as fh:
+                actual = _stream_digest(fh, algorithm)
+    except (zipfile.BadZipFile, zipfile.LargeZipFile, OSError, KeyError):
+        actual = None
+
+    return MemberCheck(
+        path=normalized,
+        ok=actual is not None and actual == expected,
+        expected_digest=expected,
+        actual_digest=actual,
+        byte_length=byte_length,
+    )
+
+
+def _overall_status(checks: tuple[MemberCheck, ...]) -> VerifyStatus:
+    if not checks:
+        return "unverified"
+    # Single pass over the checks; any non-manifest failure settles the
+    # status immediately, so large packages stop scanning at the first one.
+    saw_manifest_fail = False
+    for check in checks:
+        if check.ok:
+            continue
+        if check.path != "manifest.json":
+            return "fail"
+        saw_manifest_fail = True
+    if saw_manifest_fail:
+        return "manifest_mismatch"
+    return "pass"
+
+
+def verify_package(package_path: str | Path, manifest: dict | None = None) -> VerifyResult:
+    path_obj = Path(package_path)
+
+    try:
+        entry = get_cached_zip(path_obj)
+    except (zipfile.BadZipFile, zipfile.LargeZipFile, OSError) as exc:
+        raise InvalidArchiveError(f"Invalid or unreadable archive: {path_obj}") from exc
+
+    normalized_to_raw = entry.normalized_to_raw
+
+    # Callers that already hold the parsed manifest pass it in; otherwise the
+    # mtime-validated cache avoids re-inflating and re-decoding it here.
+    if manifest is None:
+        manifest = get_manifest(path_obj)
+
+    declared = _integrity_entries(manifest) if manifest is not None else None
+    if declared is None:
+        return VerifyResult(
+            package_path=path_obj,
+            algorithm="sha256",
+            status="unverified",
+            checks=(),
+        )
+
+    algorithm, entries = declared
+    if _new_hasher(algorithm) is None:
+        # Unknown algorithm (or optional backend not installed): report
+        # unverified rather than a false integrity failure.
+        return VerifyResult(
+            package_path=path_obj,
+            algorithm=algorithm,
+            status="unverified",
+            checks=(),
+        )
+
+    def check_one(item: tuple[str, str]) -> MemberCheck:
+        return _check_member(path_obj, normalized_to_raw, item[0], item[1], algorithm)
+
+    if len(entries) > 1:
+        max_workers = min(_MAX_HASH_WORKERS, os.cpu_count() or 1, len(entries))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            checks = tuple(executor.map(check_one, entries))
+    else:
+        checks = tuple(check_one(item) for item in entries)
+    return VerifyResult(
+        package_path=path_obj,
+        algorithm=algorithm,
+        status=_overall_status(checks),
+        checks=checks,
+    )
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import os
+import threading
+import zipfile
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+from .members import is_symlink_entry, is_unsafe_member_path, normalize_member_path
+
+
+# Keeping handles open avoids re-parsing the zip central directory on every
+# read, which otherwise dominates repeated member access on large packages.
+_MAX_OPEN_HANDLES = 32
+
+
+@dataclass(frozen=True)
+class ZipCacheEntry:
+    zipfile: zipfile.ZipFile
+    infolist: tuple[zipfile.ZipInfo, ...]
+    stat_key: tuple[int, int]
+    # Normalized member path -> raw archive name, computed once per handle so
+    # lookups are O(1) instead of an infolist scan per read.
+    normalized_to_raw: dict[str, str]
+    # Same mapping restricted to members that pass the path-safety and
+    # symlink checks; readers that tolerate missing members use this one.
+    safe_normalized_to_raw: dict[str, str]
+
+
+def _advise_willneed(zf: zipfile.ZipFile) -> None:
+    # Ask the kernel to start readahead on the whole package so member
+    # reads that follow shortly are served from the page cache. Best
+    # effort; posix_fadvise is POSIX-only.
+    if not hasattr(os, "posix_fadvise"):
+        return
+    fp = getattr(zf, "fp", None)
+    if fp is None:
+        return
+    try:
+        os.posix_fadvise(fp.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+    except (OSError, ValueError, AttributeError):
+        pass
+
+
+class ZipHandleCache:
+    def __init__(self, max_open_handles: int = _MAX_OPEN_HANDLES) -> None:
+        self._max_open_handles = max_open_handles
+        self._entries: OrderedDict[Path, ZipCacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, package_path: str | Path) -> ZipCacheEntry:
+        resolved = Path(package_path).resolve()
+        stat = resolved.stat()
+        stat_key = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            entry = self._entries.get(resolved)
+            if entry is not None and entry.stat_key == stat_key:
+                self._entries.move_to_end(resolved)
+                return entry
+
+        # Open outside the lock; parsing the central directory can be slow.
+        zf = zipfile.ZipFile(resolved, "r")
+        _advise_willneed(zf)
+        infolist = tuple(zf.infolist())
+        normalized_to_raw: dict[str, str] = {}
+        safe_normalized_to_raw: dict[str, str] = {}
+        for info in infolist:
+            if info.is_dir():
+                continue
+            normalized = normalize_member_path(info.filename)
+            normalized_to_raw.setdefault(normalized, info.filename)
+            if is_unsafe_member_path(normalized) or is_symlink_entry(info):
+                continue
+            safe_normalized_to_raw.setdefault(normalized, info.filename)
+        entry = ZipCacheEntry(
+            zipfile=zf,
+            infolist=infolist,
+            stat_key=stat_key,
+            normalized_to_raw=normalized_to_raw,
+            safe_normalized_to_raw=safe_normalized_to_raw,
+        )
+
+        with self._lock:
+            # Evicted and stale handles are dropped, not closed: another
+            # thread may still be reading through them (prefetch workers,
+            # the UI thread). Open member readers hold a reference to the
+            # ZipFile, so it is closed by its finalizer once the last
+            # reader finishes.
+            self._entries.pop(resolved, None)
+            self._entries[resolved] = entry
+            while len(self._entries) > self._max_open_handles:
+                self._entries.popitem(last=False)
+        return entry
+
+    def close_all(self) -> None:
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+        for entry in entries:
+            entry.zipfile.close()
+
+
+_default_cache = ZipHandleCache()
+
+
+def get_cached_zip(package_path: str | Path) -> ZipCacheEntry:
+    return _default_cache.get(package_path)
+
+
+def close_cached_zips() -> None:
+    _default_cache.close_all()
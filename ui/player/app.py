@@ -1,8 +1,11 @@
 #!/usr/bin/env python3
 import json
+import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
-from pathlib import Path, PurePosixPath
+from pathlib import Path
 import zipfile
 
 from PySide6 import QtCore, QtGui, QtWidgets
@@ -10,59 +13,121 @@ from PySide6.QtCore import QBuffer, QByteArray, QIODevice, QUrl
 from PySide6.QtMultimedia import QAudioOutput, QMediaPlayer
 from PySide6.QtMultimediaWidgets import QVideoWidget
 
-from core import SafeOpenError, safe_open_package
-
-def _normalize_member_path(raw_name: str) -> str:
-    normalized = raw_name.replace("\\", "/")
-    while normalized.startswith("./"):
-        normalized = normalized[2:]
-    return normalized
-
+from core import (
+    PayloadCache,
+    SafeOpenError,
+    close_cached_zips,
+    get_cached_zip,
+    is_unsafe_member_path,
+    normalize_member_path,
+    parse_manifest_bytes,
+    safe_open_package,
+    stored_member_range,
+)
+
+
+class _ZipMemberDevice(QIODevice):
+    # Random-access view over an uncompressed member's byte range inside a
+    # package, so stored audio/video plays with no temp copy at all.
+
+    def __init__(
+        self,
+        package_path: Path,
+        data_offset: int,
+        data_size: int,
+        parent: QtCore.QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+        # Unbuffered: every readData already asks for a sized chunk, so the
+        # BufferedReader layer would only add an intermediate copy.
+        self._file = open(package_path, "rb", buffering=0)
+        self._data_offset = data_offset
+        self._data_size = data_size
+
+    def isSequential(self) -> bool:
+        return False
 
-def _is_unsafe_member_path(normalized: str) -> bool:
-    if not normalized:
-        return True
-    if normalized.startswith("/"):
-        return True
-    if len(normalized) >= 2 and normalized[1] == ":":
-        return True
-    return ".." in PurePosixPath(normalized).parts
+    def size(self) -> int:
+        return self._data_size
 
+    def readData(self, maxlen: int) -> bytes:
+        position = self.pos()
+        if position >= self._data_size:
+            return b""
+        length = min(maxlen, self._data_size - position)
+        if hasattr(os, "pread"):
+            # One positioned read per call instead of a seek + read pair.
+            return os.pread(self._file.fileno(), length, self._data_offset + position)
+        self._file.seek(self._data_offset + position)
+        return self._file.read(length)
 
-def _is_symlink_entry(info: zipfile.ZipInfo) -> bool:
-    mode = (info.external_attr >> 16) & 0o170000
-    return mode == 0o120000
+    def close(self) -> None:
+        super().close()
+        self._file.close()
 
 
 def safe_read_member_bytes(package_path: Path, normalized_member_path: str) -> bytes | None:
-    normalized_target = _normalize_member_path(normalized_member_path)
-    if _is_unsafe_member_path(normalized_target):
+    normalized_target = normalize_member_path(normalized_member_path)
+    if is_unsafe_member_path(normalized_target):
         return None
 
     try:
-        with zipfile.ZipFile(package_path, "r") as zf:
-            for info in zf.infolist():
-                if info.is_dir():
-                    continue
-                normalized_info_path = _normalize_member_path(info.filename)
-                if normalized_info_path != normalized_target:
-                    continue
-                if _is_unsafe_member_path(normalized_info_path):
-                    return None
-                if _is_symlink_entry(info):
-                    return None
-                return zf.read(info.filename)
+        entry = get_cached_zip(package_path)
+        # The cached map already excludes unsafe paths and symlink entries.
+        raw_name = entry.safe_normalized_to_raw.get(normalized_target)
+        if raw_name is None:
+            return None
+        return entry.zipfile.read(raw_name)
     except (zipfile.BadZipFile, zipfile.LargeZipFile, OSError, KeyError):
         return None
 
-    return None
-
 
 _IMAGE_EXTS = {".png", ".jpg", ".jpeg", ".webp"}
 _AUDIO_EXTS = {".mp3", ".wav", ".flac", ".m4a", ".aac", ".ogg", ".opus"}
 _VIDEO_EXTS = {".mp4", ".mov", ".mkv", ".webm", ".m4v"}
 _TEXT_EXTS = {".txt", ".md", ".json"}
 
+_PREFETCH_WORKERS = 4
+
+# Upper bound on the uncompressed bytes the background prefetch may extract
+# per package open; members beyond the budget wait for first activation.
+_PREFETCH_TOTAL_BUDGET = 256 << 20
+
+# Covers are often much larger than they are ever displayed; decoding them
+# capped to this edge length keeps decode time and pixmap memory bounded.
+_COVER_DECODE_MAX_EDGE = 1024
+
+# Pre-split manifest key paths, walked by _manifest_value; splitting dotted
+# strings per lookup would redo the same work on every metadata refresh.
+_WORK_TITLE_PATH = ("work", "title")
+_CREATOR_NAME_PATH = ("creator", "name")
+_CREATOR_CONTACT_PATH = ("creator", "contact")
+_AI_SYSTEM_PATH = ("ai", "system")
+_VERIFICATION_TIER_PATH = ("verification", "tier")
+_PRIMARY_TOOL_PATH = ("provenance", "primary_tool")
+_SUPPORTING_TOOLS_PATH = ("provenance", "supporting_tools")
+_DECLARATION_TEXT_REF_PATH = ("metadata_refs", "declaration_text")
+_COVER_IMAGE_REF_PATH = ("metadata_refs", "cover_image")
+
+
+def _manifest_value(manifest: dict | None, path: tuple[str, ...]) -> object | None:
+    cur: object = manifest
+    for key in path:
+        if not isinstance(cur, dict):
+            return None
+        cur = cur.get(key)
+    return cur
+
+
+# Single precomputed suffix -> preview kind map so activation does one dict
+# lookup instead of probing each extension set in turn.
+_SUFFIX_KIND: dict[str, str] = (
+    {ext: "image" for ext in _IMAGE_EXTS}
+    | {ext: "audio" for ext in _AUDIO_EXTS}
+    | {ext: "video" for ext in _VIDEO_EXTS}
+    | {ext: "text" for ext in _TEXT_EXTS}
+)
+
 
 class MainWindow(QtWidgets.QMainWindow):
     def __init__(self) -> None:
@@ -72,17 +137,25 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self._media_bytes_qba: QByteArray | None = None
         self._media_buffer: QBuffer | None = None
+        self._member_device: _ZipMemberDevice | None = None
         self._loaded_pixmap: QtGui.QPixmap | None = None
+        self._scaled_cache_key: tuple[int, int, int] | None = None
+        self._placeholder_cache: dict[tuple[str, int, int], QtGui.QPixmap] = {}
+        # Decoded covers keyed by (package, member, package stat key); a None
+        # value records a failed decode so it is not retried on every open.
+        self._cover_cache: dict[tuple[Path, str, tuple[int, int]], QtGui.QPixmap | None] = {}
         self._user_seeking = False
         self._media_seekable = False
         self._current_package_path: Path | None = None
         self._current_file_paths: tuple[str, ...] = ()
+        self._current_file_paths_lower: tuple[tuple[str, str], ...] = ()
         self._is_fullscreen = False
         self._restore_state: dict[str, object] = {}
         self._restore_dock_titlebars: dict[str, QtWidgets.QWidget | None] = {}
         self._restore_window_flags: QtCore.Qt.WindowFlags | None = None
         self.settings = QtCore.QSettings("AI-First-Exchange", "AIFX Player")
         self._recent_paths: list[str] = self._load_recent_paths()
+        self._payload_cache = PayloadCache()
 
         self.audio_output = QAudioOutput(self)
         self.audio_output.setVolume(0.8)
@@ -434,21 +507,12 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _decode_manifest(self, manifest_bytes: bytes) -> tuple[str, dict | None]:
         manifest_text = manifest_bytes.decode("utf-8", errors="replace")
-        try:
-            manifest_json = json.loads(manifest_text)
-        except Exception:
-            return manifest_text, None
-        if not isinstance(manifest_json, dict):
-            return manifest_text, None
-        return manifest_text, manifest_json
+        return manifest_text, parse_manifest_bytes(manifest_bytes)
 
     def _extract_work_title(self, manifest_json: dict | None, primary_media_path: str | None) -> str:
-        if isinstance(manifest_json, dict):
-            work = manifest_json.get("work")
-            if isinstance(work, dict):
-                title = work.get("title")
-                if title is not None and str(title).strip():
-                    return str(title)
+        title = _manifest_value(manifest_json, _WORK_TITLE_PATH)
+        if title is not None and str(title).strip():
+            return str(title)
         if primary_media_path:
             return Path(primary_media_path).stem
         return "(untitled)"
@@ -461,13 +525,15 @@ class MainWindow(QtWidgets.QMainWindow):
     def _apply_files_filter(self, _text: str = "") -> None:
         needle = self.files_filter_input.text().strip().lower()
         self.files_list.clear()
-        for path in self._current_file_paths:
-            if needle and needle not in path.lower():
+        for path, lowered in self._current_file_paths_lower:
+            if needle and needle not in lowered:
                 continue
             self.files_list.addItem(path)
 
     def _populate_files_list(self, file_paths: tuple[str, ...]) -> None:
         self._current_file_paths = file_paths
+        # Lowercase once per package instead of per keystroke in the filter.
+        self._current_file_paths_lower = tuple((path, path.lower()) for path in file_paths)
         self._apply_files_filter()
 
     def _select_file_in_list(self, normalized_path: str) -> bool:
@@ -483,28 +549,17 @@ class MainWindow(QtWidgets.QMainWindow):
         if self._current_package_path is None:
             return None, "No package loaded."
 
-        normalized_target = _normalize_member_path(normalized_path)
-        if _is_unsafe_member_path(normalized_target):
+        normalized_target = normalize_member_path(normalized_path)
+        if is_unsafe_member_path(normalized_target):
             return None, "Unsafe archive member path."
 
         try:
-            with zipfile.ZipFile(self._current_package_path, "r") as zf:
-                normalized_to_raw: dict[str, str] = {}
-                for info in zf.infolist():
-                    if info.is_dir():
-                        continue
-                    normalized_info = _normalize_member_path(info.filename)
-                    if _is_unsafe_member_path(normalized_info):
-                        continue
-                    if _is_symlink_entry(info):
-                        continue
-                    normalized_to_raw.setdefault(normalized_info, info.filename)
-
-                raw_name = normalized_to_raw.get(normalized_target)
-                if raw_name is None:
-                    return None, "File not found in archive."
+            entry = get_cached_zip(self._current_package_path)
+            raw_name = entry.safe_normalized_to_raw.get(normalized_target)
+            if raw_name is None:
+                return None, "File not found in archive."
 
-                return zf.read(raw_name), None
+            return entry.zipfile.read(raw_name), None
         except (zipfile.BadZipFile, zipfile.LargeZipFile, OSError, KeyError):
             return None, "Failed to read file from archive."
 
@@ -523,10 +578,89 @@ class MainWindow(QtWidgets.QMainWindow):
         self.preview_text.setPlainText(text)
         self.preview_dock.show()
 
+    def _prefetch_package_media(
+        self, package_path: Path, package_type: str, file_paths: tuple[str, ...]
+    ) -> None:
+        # Warm the extraction cache during the user's idle time so the first
+        # activation of any media member is a cache hit. Project packages are
+        # not warmed: they can carry arbitrarily many large members, and the
+        # extraction cache lives in a RAM-backed temp root.
+        if package_type == "aifp":
+            return
+        media_paths = [
+            path
+            for path in file_paths
+            if _SUFFIX_KIND.get(Path(path).suffix.lower()) in ("audio", "video")
+        ]
+        if not media_paths:
+            return
+
+        payload_cache = self._payload_cache
+
+        def warm_all() -> None:
+            # Stored members are skipped (they play in place without
+            # extraction), and warming stops at a fixed byte budget so
+            # opening a package cannot flood the temp root.
+            try:
+                entry = get_cached_zip(package_path)
+                budget = _PREFETCH_TOTAL_BUDGET
+                to_warm: list[str] = []
+                for member_path in media_paths:
+                    raw_name = entry.safe_normalized_to_raw.get(member_path)
+                    if raw_name is None:
+                        continue
+                    if stored_member_range(package_path, member_path) is not None:
+                        continue
+                    size = entry.zipfile.getinfo(raw_name).file_size
+                    if size > budget:
+                        continue
+                    budget -= size
+                    to_warm.append(member_path)
+            except (zipfile.BadZipFile, zipfile.LargeZipFile, OSError, KeyError):
+                return
+            if not to_warm:
+                return
+            with ThreadPoolExecutor(max_workers=_PREFETCH_WORKERS) as executor:
+                for member_path in to_warm:
+                    executor.submit(payload_cache.get_media_file, package_path, member_path)
+
+        threading.Thread(target=warm_all, name="aifx-media-prefetch", daemon=True).start()
+
+    def _load_member_media(self, normalized_path: str) -> bool:
+        if self._current_package_path is not None:
+            if self._load_media_from_package(self._current_package_path, normalized_path):
+                return True
+
+        file_bytes, _ = self._read_current_member_bytes(normalized_path)
+        if file_bytes is None:
+            return False
+        self._load_media_from_bytes(file_bytes, normalized_path)
+        return True
+
     @QtCore.Slot(QtWidgets.QListWidgetItem)
     def _on_files_item_activated(self, item: QtWidgets.QListWidgetItem) -> None:
         selected_path = item.text()
-        suffix = Path(selected_path).suffix.lower()
+        kind = _SUFFIX_KIND.get(Path(selected_path).suffix.lower())
+
+        # Keep preview interactions read-only and manual; never autoplay.
+        self.player.stop()
+
+        if kind in ("audio", "video"):
+            # Media members stream from an extracted temp file; only the
+            # in-memory fallback materializes the whole member.
+            self._clear_image()
+            if not self._load_member_media(selected_path):
+                QtWidgets.QMessageBox.information(
+                    self,
+                    "Preview",
+                    f"Failed to read file from archive: {selected_path}",
+                )
+                return
+            self._set_controls_enabled(True)
+            self.video_widget.setVisible(kind == "video")
+            self._update_overlay_play_visibility()
+            return
+
         file_bytes, error = self._read_current_member_bytes(selected_path)
         if file_bytes is None:
             QtWidgets.QMessageBox.information(
@@ -536,33 +670,14 @@ class MainWindow(QtWidgets.QMainWindow):
             )
             return
 
-        # Keep preview interactions read-only and manual; never autoplay.
-        self.player.stop()
-
-        if suffix in _IMAGE_EXTS:
+        if kind == "image":
             self._clear_media_source()
             self.video_widget.hide()
             if self._show_image_from_bytes(file_bytes):
                 self._set_controls_enabled(False)
             return
 
-        if suffix in _AUDIO_EXTS:
-            self._clear_image()
-            self._load_media_from_bytes(file_bytes, selected_path)
-            self._set_controls_enabled(True)
-            self.video_widget.hide()
-            self._update_overlay_play_visibility()
-            return
-
-        if suffix in _VIDEO_EXTS:
-            self._clear_image()
-            self._load_media_from_bytes(file_bytes, selected_path)
-            self._set_controls_enabled(True)
-            self.video_widget.show()
-            self._update_overlay_play_visibility()
-            return
-
-        if suffix in _TEXT_EXTS:
+        if kind == "text":
             self._clear_media_source()
             self._clear_image()
             self.video_widget.hide()
@@ -796,39 +911,36 @@ class MainWindow(QtWidgets.QMainWindow):
                 self._add_metadata_section("AIFX Version", version_rows)
 
             provenance_rows: list[tuple[str, str]] = []
-            creator = manifest_json.get("creator")
-            if isinstance(creator, dict):
-                if creator.get("name") is not None:
-                    provenance_rows.append(("Creator", str(creator.get("name"))))
-                if creator.get("contact") is not None:
-                    provenance_rows.append(("Contact", str(creator.get("contact"))))
-            ai = manifest_json.get("ai")
-            if isinstance(ai, dict) and ai.get("system") is not None:
-                provenance_rows.append(("AI System", str(ai.get("system"))))
+            creator_name = _manifest_value(manifest_json, _CREATOR_NAME_PATH)
+            if creator_name is not None:
+                provenance_rows.append(("Creator", str(creator_name)))
+            creator_contact = _manifest_value(manifest_json, _CREATOR_CONTACT_PATH)
+            if creator_contact is not None:
+                provenance_rows.append(("Contact", str(creator_contact)))
+            ai_system = _manifest_value(manifest_json, _AI_SYSTEM_PATH)
+            if ai_system is not None:
+                provenance_rows.append(("AI System", str(ai_system)))
             if manifest_json.get("mode") is not None:
                 provenance_rows.append(("Mode", str(manifest_json.get("mode"))))
-            verification = manifest_json.get("verification")
-            if isinstance(verification, dict) and verification.get("tier") is not None:
-                provenance_rows.append(("Verification Tier", str(verification.get("tier"))))
-            provenance = manifest_json.get("provenance")
-            if isinstance(provenance, dict):
-                if provenance.get("primary_tool") is not None:
-                    provenance_rows.append(("Primary Tool", self._format_tool_entry(provenance.get("primary_tool"))))
-                if provenance.get("supporting_tools") is not None:
-                    support = provenance.get("supporting_tools")
-                    support_text = self._format_supporting_tools(support)
-                    provenance_rows.append(("Supporting Tools", support_text))
+            verification_tier = _manifest_value(manifest_json, _VERIFICATION_TIER_PATH)
+            if verification_tier is not None:
+                provenance_rows.append(("Verification Tier", str(verification_tier)))
+            primary_tool = _manifest_value(manifest_json, _PRIMARY_TOOL_PATH)
+            if primary_tool is not None:
+                provenance_rows.append(("Primary Tool", self._format_tool_entry(primary_tool)))
+            supporting_tools = _manifest_value(manifest_json, _SUPPORTING_TOOLS_PATH)
+            if supporting_tools is not None:
+                support_text = self._format_supporting_tools(supporting_tools)
+                provenance_rows.append(("Supporting Tools", support_text))
             if provenance_rows:
                 self._add_metadata_section("Provenance", provenance_rows)
 
             declaration_text: str | None = None
-            metadata_refs = manifest_json.get("metadata_refs")
-            if isinstance(metadata_refs, dict):
-                declaration_path = metadata_refs.get("declaration_text")
-                if isinstance(declaration_path, str):
-                    declaration_bytes = safe_read_member_bytes(result.package_path, declaration_path)
-                    if declaration_bytes is not None:
-                        declaration_text = declaration_bytes.decode("utf-8", errors="replace")
+            declaration_path = _manifest_value(manifest_json, _DECLARATION_TEXT_REF_PATH)
+            if isinstance(declaration_path, str):
+                declaration_bytes = safe_read_member_bytes(result.package_path, declaration_path)
+                if declaration_bytes is not None:
+                    declaration_text = declaration_bytes.decode("utf-8", errors="replace")
 
             if declaration_text is None and manifest_json.get("declaration") is not None:
                 declaration_obj = manifest_json.get("declaration")
@@ -840,11 +952,9 @@ class MainWindow(QtWidgets.QMainWindow):
             if declaration_text is not None:
                 self._add_metadata_text_section("Declaration", declaration_text)
         else:
-            work = manifest_json.get("work")
-            if isinstance(work, dict):
-                title = work.get("title")
-                if title is not None:
-                    self._add_metadata_section("Work", [("Title", str(title))])
+            title = _manifest_value(manifest_json, _WORK_TITLE_PATH)
+            if title is not None:
+                self._add_metadata_section("Work", [("Title", str(title))])
 
             fmt = manifest_json.get("format")
             if fmt is not None:
@@ -854,18 +964,16 @@ class MainWindow(QtWidgets.QMainWindow):
             if aifx_version is not None:
                 self._add_metadata_section("AIFX", [("Version", str(aifx_version))])
 
-            provenance = manifest_json.get("provenance")
-            if isinstance(provenance, dict):
-                provenance_rows: list[tuple[str, str]] = []
-                primary_tool = provenance.get("primary_tool")
-                if primary_tool is not None:
-                    provenance_rows.append(("Primary Tool", self._format_tool_entry(primary_tool)))
-                supporting_tools = provenance.get("supporting_tools")
-                if supporting_tools is not None:
-                    supporting_value = self._format_supporting_tools(supporting_tools)
-                    provenance_rows.append(("Supporting Tools", supporting_value))
-                if provenance_rows:
-                    self._add_metadata_section("Provenance", provenance_rows)
+            provenance_rows: list[tuple[str, str]] = []
+            primary_tool = _manifest_value(manifest_json, _PRIMARY_TOOL_PATH)
+            if primary_tool is not None:
+                provenance_rows.append(("Primary Tool", self._format_tool_entry(primary_tool)))
+            supporting_tools = _manifest_value(manifest_json, _SUPPORTING_TOOLS_PATH)
+            if supporting_tools is not None:
+                supporting_value = self._format_supporting_tools(supporting_tools)
+                provenance_rows.append(("Supporting Tools", supporting_value))
+            if provenance_rows:
+                self._add_metadata_section("Provenance", provenance_rows)
 
             declaration = manifest_json.get("declaration")
             if declaration is not None:
@@ -885,13 +993,22 @@ class MainWindow(QtWidgets.QMainWindow):
         if self._media_buffer is not None and self._media_buffer.isOpen():
             self._media_buffer.close()
 
+        if self._member_device is not None:
+            if self._member_device.isOpen():
+                self._member_device.close()
+            self._member_device.deleteLater()
+
         self._media_buffer = None
         self._media_bytes_qba = None
+        self._member_device = None
         self._reset_timeline()
         self._update_overlay_play_visibility()
 
     def _clear_image(self) -> None:
         self._loaded_pixmap = None
+        # Cached pixmaps (covers, placeholders) keep their cacheKey across
+        # shows, so the scaled-image key must not survive a clear.
+        self._scaled_cache_key = None
         self.image_label.clear()
         self.image_label.hide()
         self._update_overlay_play_visibility()
@@ -899,14 +1016,23 @@ class MainWindow(QtWidgets.QMainWindow):
     def _update_scaled_image(self) -> None:
         if self._loaded_pixmap is None:
             self.image_label.clear()
+            self._scaled_cache_key = None
+            return
+
+        # Smooth rescaling is expensive; skip it when neither the pixmap nor
+        # the label size changed (resize events fire in bursts).
+        size = self.image_label.size()
+        cache_key = (self._loaded_pixmap.cacheKey(), size.width(), size.height())
+        if cache_key == self._scaled_cache_key:
             return
 
         scaled = self._loaded_pixmap.scaled(
-            self.image_label.size(),
+            size,
             QtCore.Qt.KeepAspectRatio,
             QtCore.Qt.SmoothTransformation,
         )
         self.image_label.setPixmap(scaled)
+        self._scaled_cache_key = cache_key
 
     def _show_image_from_bytes(self, image_bytes: bytes) -> bool:
         pixmap = QtGui.QPixmap()
@@ -933,6 +1059,14 @@ class MainWindow(QtWidgets.QMainWindow):
         size = self.image_label.size()
         width = max(size.width(), 1280)
         height = max(size.height(), 720)
+
+        # Rendering the placeholder repaints text every open; reuse the
+        # pixmap for a repeated (title, size) combination.
+        cache_key = (title, width, height)
+        cached = self._placeholder_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         pixmap = QtGui.QPixmap(width, height)
         pixmap.fill(QtGui.QColor("black"))
         painter = QtGui.QPainter(pixmap)
@@ -955,25 +1089,60 @@ class MainWindow(QtWidgets.QMainWindow):
             title,
         )
         painter.end()
+        if len(self._placeholder_cache) >= 8:
+            self._placeholder_cache.clear()
+        self._placeholder_cache[cache_key] = pixmap
+        return pixmap
+
+    def _decode_cover_bytes(self, cover_bytes: bytes) -> QtGui.QPixmap | None:
+        buffer = QBuffer()
+        buffer.setData(QByteArray(cover_bytes))
+        buffer.open(QIODevice.ReadOnly)
+        reader = QtGui.QImageReader(buffer)
+        reader.setAutoTransform(True)
+        # Decode at a capped resolution; for formats with decoder-side
+        # scaling (JPEG) this also skips inflating the full-size image.
+        source_size = reader.size()
+        if source_size.isValid() and (
+            source_size.width() > _COVER_DECODE_MAX_EDGE
+            or source_size.height() > _COVER_DECODE_MAX_EDGE
+        ):
+            reader.setScaledSize(
+                source_size.scaled(
+                    _COVER_DECODE_MAX_EDGE, _COVER_DECODE_MAX_EDGE, QtCore.Qt.KeepAspectRatio
+                )
+            )
+        image = reader.read()
+        if image.isNull():
+            return None
+        return QtGui.QPixmap.fromImage(image)
+
+    def _load_cover_pixmap(self, package_path: Path, cover_path: str) -> QtGui.QPixmap | None:
+        try:
+            stat_key = get_cached_zip(package_path).stat_key
+        except (zipfile.BadZipFile, zipfile.LargeZipFile, OSError):
+            return None
+
+        cache_key = (package_path, cover_path, stat_key)
+        if cache_key in self._cover_cache:
+            return self._cover_cache[cache_key]
+
+        cover_bytes = safe_read_member_bytes(package_path, cover_path)
+        pixmap = self._decode_cover_bytes(cover_bytes) if cover_bytes is not None else None
+        if len(self._cover_cache) >= 8:
+            self._cover_cache.clear()
+        self._cover_cache[cache_key] = pixmap
         return pixmap
 
     def _show_aifm_artwork_or_placeholder(self, result, manifest_json: dict | None) -> None:
         title = self._extract_work_title(manifest_json, result.primary_media_path)
-        cover_path: str | None = None
-        if isinstance(manifest_json, dict):
-            metadata_refs = manifest_json.get("metadata_refs")
-            if isinstance(metadata_refs, dict):
-                raw_cover = metadata_refs.get("cover_image")
-                if isinstance(raw_cover, str):
-                    cover_path = raw_cover
-
-        if cover_path:
-            cover_bytes = safe_read_member_bytes(result.package_path, cover_path)
-            if cover_bytes is not None:
-                cover_pixmap = QtGui.QPixmap()
-                if cover_pixmap.loadFromData(cover_bytes):
-                    self._show_pixmap(cover_pixmap)
-                    return
+        raw_cover = _manifest_value(manifest_json, _COVER_IMAGE_REF_PATH)
+
+        if isinstance(raw_cover, str) and raw_cover:
+            cover_pixmap = self._load_cover_pixmap(result.package_path, raw_cover)
+            if cover_pixmap is not None:
+                self._show_pixmap(cover_pixmap)
+                return
 
         self._show_pixmap(self._make_aifm_placeholder_pixmap(title))
 
@@ -995,6 +1164,67 @@ class MainWindow(QtWidgets.QMainWindow):
         self._on_seekable_changed(self.player.isSeekable())
         self._update_overlay_play_visibility()
 
+    def _load_media_from_file(self, media_file: Path) -> None:
+        self._clear_media_source()
+
+        # Playing from a local file keeps peak memory at O(1) regardless of
+        # media size; the decoder streams from disk instead of a RAM buffer.
+        self.player.setSource(QUrl.fromLocalFile(str(media_file)))
+        self._has_loaded_media = True
+        self._on_seekable_changed(self.player.isSeekable())
+        self._update_overlay_play_visibility()
+
+    def _load_media_from_stored_member(self, package_path: Path, member_path: str) -> bool:
+        member_range = stored_member_range(package_path, member_path)
+        if member_range is None:
+            return False
+
+        self._clear_media_source()
+        try:
+            device = _ZipMemberDevice(package_path, member_range[0], member_range[1], self)
+        except OSError:
+            return False
+        if not device.open(QIODevice.ReadOnly):
+            device.deleteLater()
+            return False
+
+        self._member_device = device
+        # Suffix hint for codec inference, as with the in-memory path.
+        self.player.setSourceDevice(device, QUrl.fromLocalFile(member_path))
+        self._has_loaded_media = True
+        self._on_seekable_changed(self.player.isSeekable())
+        self._update_overlay_play_visibility()
+        return True
+
+    def _load_media_from_package(self, package_path: Path, member_path: str) -> bool:
+        # Stored members play straight out of the package file; compressed
+        # ones are streamed to a temp file first.
+        if self._load_media_from_stored_member(package_path, member_path):
+            return True
+
+        media_file = self._payload_cache.get_media_file(package_path, member_path)
+        if media_file is not None:
+            self._load_media_from_file(media_file)
+            return True
+        return False
+
+    def _load_primary_media(self, result) -> bool:
+        if result.primary_media_path is None:
+            return False
+
+        if self._load_media_from_package(result.package_path, result.primary_media_path):
+            return True
+
+        if result.primary_media_bytes is not None:
+            self._load_media_from_bytes(result.primary_media_bytes, result.primary_media_path)
+            return True
+
+        media_bytes = safe_read_member_bytes(result.package_path, result.primary_media_path)
+        if media_bytes is None:
+            return False
+        self._load_media_from_bytes(media_bytes, result.primary_media_path)
+        return True
+
     def _on_playback_error(self, _error: QMediaPlayer.Error) -> None:
         QtWidgets.QMessageBox.critical(self, "Playback Error", self.player.errorString())
 
@@ -1089,6 +1319,12 @@ class MainWindow(QtWidgets.QMainWindow):
         if self._is_fullscreen:
             self._exit_fullscreen()
 
+    def closeEvent(self, event: QtGui.QCloseEvent) -> None:
+        self._clear_media_source()
+        self._payload_cache.close()
+        close_cached_zips()
+        super().closeEvent(event)
+
     @QtCore.Slot()
     def on_open(self) -> None:
         file_path, _ = QtWidgets.QFileDialog.getOpenFileName(
@@ -1103,7 +1339,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _open_package_path(self, file_path: str) -> None:
         try:
-            result = safe_open_package(file_path)
+            result = safe_open_package(file_path, include_primary_media_bytes=False)
         except SafeOpenError as exc:
             QtWidgets.QMessageBox.critical(self, "Open Error", str(exc))
             return
@@ -1122,6 +1358,9 @@ class MainWindow(QtWidgets.QMainWindow):
         self._current_package_path = result.package_path
         self._populate_files_list(result.file_paths)
         self.empty_label.hide()
+        self._prefetch_package_media(
+            result.package_path, result.package_type, result.file_paths
+        )
 
         if result.package_type == "aifp":
             if not self.files_dock.isVisible():
@@ -1132,16 +1371,17 @@ class MainWindow(QtWidgets.QMainWindow):
                 if manifest_preview_bytes is not None:
                     self._show_text_preview("manifest.json", manifest_preview_bytes)
 
-        if result.package_type == "aifi" and result.primary_media_bytes is not None:
-            self._clear_media_source()
-            self.video_widget.hide()
-            self._show_image_from_bytes(result.primary_media_bytes)
-            self._set_controls_enabled(False)
-            self._update_overlay_play_visibility()
-            return
+        if result.package_type == "aifi" and result.primary_media_path is not None:
+            image_bytes = safe_read_member_bytes(result.package_path, result.primary_media_path)
+            if image_bytes is not None:
+                self._clear_media_source()
+                self.video_widget.hide()
+                self._show_image_from_bytes(image_bytes)
+                self._set_controls_enabled(False)
+                self._update_overlay_play_visibility()
+                return
 
-        if result.package_type == "aifm" and result.primary_media_bytes is not None:
-            self._load_media_from_bytes(result.primary_media_bytes, result.primary_media_path)
+        if result.package_type == "aifm" and self._load_primary_media(result):
             self._set_controls_enabled(True)
             self.video_widget.hide()
             self._show_aifm_artwork_or_placeholder(result, manifest_json)
@@ -1150,8 +1390,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self._clear_image()
 
-        if result.package_type == "aifv" and result.primary_media_bytes is not None:
-            self._load_media_from_bytes(result.primary_media_bytes, result.primary_media_path)
+        if result.package_type == "aifv" and self._load_primary_media(result):
             self._set_controls_enabled(True)
             self.video_widget.show()
             self._update_overlay_play_visibility()